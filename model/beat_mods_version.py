@@ -1,4 +1,34 @@
+import re
+import sys
 from functools import total_ordering
+from typing import Tuple, Union
+
+# fast path for the overwhelmingly common MAJOR.MINOR.PATCH[.BUILD] all-numeric shape
+_NUMERIC_VERSION_PATTERN = re.compile(r"(\d+)(?:\.(\d+))?(?:\.(\d+))?(?:\.(\d+))?")
+
+
+def _parse_part(part: str) -> Tuple[int, Union[int, str]]:
+    """
+    Converts a single dot-separated version segment into a comparable token. Numeric segments sort
+    numerically and before non-numeric segments (e.g. "0p1"), similar to semver prerelease rules.
+    :param part: A single version segment
+    :return: A tuple that compares correctly against other parsed segments
+    """
+    return (0, int(part)) if part.isdigit() else (1, part)
+
+
+def version_key(raw: str) -> Tuple[Tuple[int, Union[int, str]], ...]:
+    """
+    Parses a dotted version string into its comparison key. Fully numeric versions are handled by
+    a single precompiled regex match; versions with non-numeric segments (e.g. "1.1.0p1") fall
+    back to per-segment parsing, producing identically shaped tokens.
+    :param raw: A dotted version string
+    :return: A tuple of comparable tokens
+    """
+    match = _NUMERIC_VERSION_PATTERN.fullmatch(raw)
+    if match:
+        return tuple((0, int(group)) for group in match.groups() if group is not None)
+    return tuple(_parse_part(part) for part in raw.split('.'))
 
 
 @total_ordering
@@ -7,6 +37,8 @@ class BeatModsVersion:
     Represents a BeatSaber version as represented by BeatMods.
     """
 
+    __slots__ = ('_version', '_alias', '_key')
+
     def __init__(self, version: str, alias: str):
         """
         Creates a new a BeatModsVersion.
@@ -14,8 +46,14 @@ class BeatModsVersion:
                         with compatible mods.
         :param alias: The Beat Saber version number. May be the same as version.
         """
-        self._version = version
-        self._alias = alias
+        # the same version/alias strings repeat across the whole aliases blob; intern them so
+        # equality checks are pointer compares and duplicates share storage
+        self._version = sys.intern(version)
+        self._alias = sys.intern(alias)
+        # parse once up front - comparisons happen O(N log N) times during sorts, so re-splitting
+        # the same strings on every compare is pure waste. Typed tokens make each comparison a
+        # single C-level tuple compare rather than a Python loop over string segments.
+        self._key = (version_key(version), version_key(alias))
 
     def __str__(self):
         return f"Beat Saber v{self.alias} (BeatMods v{self.version})"
@@ -24,30 +62,28 @@ class BeatModsVersion:
         return f"<{str(self)}>"
 
     def __gt__(self, other):
-        # compare version first, then alias
-        for a, b in zip(self.version.split('.'), other.version.split('.')):
-            # these are string comparisons, so if one is longer it's always a higher number (more digits)
-            if len(a) != len(b):
-                return len(a) > len(b)
-            if a != b:
-                return a > b
-        for a, b in zip(self.alias.split('.'), other.alias.split('.')):
-            if len(a) != len(b):
-                return len(a) > len(b)
-            if a != b:
-                return a > b
-        # if we've gotten here, we that means we're equal
-        return False
-
-    def __eq__(self, other):
         if not isinstance(other, BeatModsVersion):
+            return NotImplemented
+        # equal inputs are common during sorts/dedup; the strings are interned, so this check
+        # short-circuits on pointer identity before touching the key tuples at all
+        if self._version == other._version and self._alias == other._alias:
             return False
+        # compare version first, then alias - the key tuples are built in that order
+        return self._key > other._key
 
-        # self can never be None...
-        if other is None:
-            return False
+    def __eq__(self, other):
+        if self is other:
+            return True
+        # exact type check - nothing subclasses BeatModsVersion, so skip isinstance's MRO walk
+        if type(other) is not BeatModsVersion:
+            return NotImplemented
+
+        return self._key == other._key
 
-        return self.version == other.version and self.alias == other.alias
+    def __hash__(self):
+        # defining __eq__ suppresses the default hash; restore one consistent with key equality
+        # so versions can live in sets/dicts
+        return hash(self._key)
 
     @property
     def alias(self) -> str:
@@ -1,5 +1,5 @@
-from typing import List, Optional
-from copy import deepcopy
+import sys
+from typing import Callable, FrozenSet, Iterable, Optional, Tuple
 
 
 class FileHash:
@@ -7,14 +7,21 @@ class FileHash:
     Represents a vile and its hash, for comparison
     """
 
-    def __init__(self, file: str, md5_hash: str):
+    __slots__ = ('_file', '_md5_hash', '_hash_fn')
+
+    def __init__(self, file: str, md5_hash: Optional[str] = None,
+                 hash_fn: Optional[Callable[[], str]] = None):
         """
-        Initializes a FileHash
+        Initializes a FileHash. Exactly one of md5_hash and hash_fn should be provided.
         :param file: The file path. Can be absolute or relative to the install directory
-        :param md5_hash: The hash of the file
+        :param md5_hash: The hash of the file, if already known
+        :param hash_fn: A zero-argument callable producing the hash, invoked on first access
         """
         self._file = file
-        self._md5_hash = md5_hash
+        # the same hash string shows up on every version of an unchanged file; interning
+        # dedupes the storage and lets equality short-circuit on pointer identity
+        self._md5_hash = sys.intern(md5_hash) if md5_hash is not None else None
+        self._hash_fn = hash_fn
 
     @property
     def file(self) -> str:
@@ -26,19 +33,28 @@ class FileHash:
     @property
     def hash(self) -> str:
         """
-        The hash of the file
+        The hash of the file. Resolved on first access when constructed with a hash_fn
         """
+        if self._md5_hash is None:
+            self._md5_hash = sys.intern(self._hash_fn())
+            self._hash_fn = None
         return self._md5_hash
 
     def __eq__(self, other):
-        if not isinstance(other, FileHash):
+        if self is other:
+            return True
+        # exact type check - nothing subclasses FileHash, so skip isinstance's MRO walk
+        if type(other) is not FileHash:
             return False
 
-        if (self is None and other is not None) or (self is not None and other is None):
-            return False
+        # doesn't matter where the file is actually at, 2 files are equal if they have the same hash.
+        # interned hashes make the identity check a near-free fast path
+        mine, theirs = self.hash, other.hash
+        return mine is theirs or mine == theirs
 
-        # doesn't matter where the file is actually at, 2 files are equal if they have the same hash
-        return self.hash == other.hash
+    def __hash__(self):
+        # consistent with __eq__ - only the content hash matters, not the location
+        return hash(self.hash)
 
     def __str__(self):
         return f"{self.file} md5={self.hash}"
@@ -49,18 +65,30 @@ class FileHash:
 
 class Mod:
 
-    def __init__(self, name: str, version: Optional[str], link: Optional[str], files: List[List[FileHash]]):
+    __slots__ = ('_name', '_version', '_link', '_files', '_flat_files', '_hash_set')
+
+    def __init__(self, name: str, version: Optional[str], link: Optional[str],
+                 files: Iterable[Iterable[FileHash]]):
         """
         Initializes a mod
         :param name: The name of the mod
         :param version: The version of the mod, if it's on BeatMods
         :param link: The link to the mod page, if it's on BeatMods
-        :param files: A list of lists of FileHash objects
+        :param files: FileHash objects grouped by download
         """
-        self._name = name
+        # mod names recur across versions and between the installed/available lists
+        self._name = sys.intern(name)
         self._version = version
         self._link = link
-        self._files = files
+        # freeze into tuples - FileHash is immutable, so the files property can hand out this
+        # view directly instead of deepcopying the whole structure on every access
+        self._files = tuple(tuple(sublist) for sublist in files)
+        # flatten once at construction so callers that iterate all files don't have to rebuild
+        # this from the nested structure each time
+        self._flat_files = tuple(fh for sublist in self._files for fh in sublist)
+        # the set of file hashes, built on first use by the hash_set property - building it here would
+        # defeat lazily-hashed FileHash objects by forcing every hash at construction
+        self._hash_set = None
 
     @property
     def name(self) -> str:
@@ -84,11 +112,28 @@ class Mod:
         return self._link
 
     @property
-    def files(self) -> List[List[FileHash]]:
+    def files(self) -> Tuple[Tuple[FileHash, ...], ...]:
         """
         Files installed with the mod, grouped by logical install download zips
         """
-        return deepcopy(self._files)
+        return self._files
+
+    @property
+    def flat_files(self) -> Tuple[FileHash, ...]:
+        """
+        All files installed with the mod, without the download zip grouping
+        """
+        return self._flat_files
+
+    @property
+    def hash_set(self) -> FrozenSet[str]:
+        """
+        The set of this mod's file hashes, so matching is a C-level set operation instead of a
+        nested scan with a Python __eq__ call per probe. Computed on demand and cached
+        """
+        if self._hash_set is None:
+            self._hash_set = frozenset(fh.hash for fh in self._flat_files)
+        return self._hash_set
 
     def do_names_match(self, other):
         """
@@ -106,11 +151,7 @@ class Mod:
         :return: Whether the mods are the same
         """
         # 2 mods can be considered equal if any of their files have the same hash
-        # flatten both mod lists for convenient
-        self_files_flat = [file for sublist in self._files for file in sublist]
-        other_files_flat = [file for sublist in other.files for file in sublist]
-
-        return any(file in other_files_flat for file in self_files_flat)
+        return not self.hash_set.isdisjoint(other.hash_set)
 
     def __str__(self):
         return f"{self.name} v{self.version}"
@@ -1,9 +1,23 @@
+import functools
 from abc import ABC, abstractmethod
-from typing import Iterable, Optional
+from typing import Any, Callable, Iterable, Optional
 
 from model.beat_mods_version import BeatModsVersion
 
 
+def memoized_formatter(formatter: Callable[[Any], str]) -> Callable[[Any], str]:
+    """
+    Wraps a cell formatter with a small memo cache. Reports repeat the same cell values constantly
+    (mod names across categories, "-", common version strings), so a cache lookup beats re-running
+    the formatter. Only valid for formatters that are pure functions of their input.
+    :param formatter: The dtype callable to wrap
+    :return: The memoized formatter, or the original if it's a builtin type (already C-level)
+    """
+    if isinstance(formatter, type):
+        return formatter
+    return functools.lru_cache(maxsize=256)(formatter)
+
+
 class BaseTableUI(ABC):
     @abstractmethod
     def set_versions(self, old_version: BeatModsVersion, new_version: BeatModsVersion):
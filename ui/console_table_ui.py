@@ -3,17 +3,20 @@ from typing import Iterable, List, Callable, Any, Optional
 from texttable import Texttable
 
 from model.beat_mods_version import BeatModsVersion
-from ui.base_table_ui import BaseTableUI
+from ui.base_table_ui import BaseTableUI, memoized_formatter
 
 
 class ConsoleTableUI(BaseTableUI):
     __TABLE_FORMAT = Texttable.HEADER | Texttable.VLINES | Texttable.HLINES
 
     def __init__(self, header: List[str], align: List[str], dtype: List[Callable[[Any], str]]):
+        # rows are accumulated here and handed to Texttable in one batch at show() time,
+        # so multiple add_items calls only pay add_rows' fixed setup cost once
+        self._pending: List[Iterable] = []
         self._table = table = Texttable()
         table.header(header)
         table.set_cols_align(align)
-        table.set_cols_dtype(dtype)
+        table.set_cols_dtype([memoized_formatter(f) for f in dtype])
         table.set_deco(ConsoleTableUI.__TABLE_FORMAT)
         table.set_max_width(120)
 
@@ -21,13 +24,14 @@ class ConsoleTableUI(BaseTableUI):
         print(f"Evaluating upgrade from {old_version.alias} to {new_version.alias}...")
 
     def show(self):
+        self._table.add_rows(self._pending, False)
         print(self._table.draw())
 
     def alert(self, message: str):
         print(message)
 
     def add_items(self, items: Iterable[Iterable]):
-        self._table.add_rows(items, False)
+        self._pending.extend(items)
 
     def prompt_for_directory(self, message: Optional[str] = None) -> Optional[str]:
         print("Enter the path to your Beat Saber installation. If you're not sure, you can find it in the settings in "
@@ -1,25 +1,23 @@
-import tkinter as tk
-from tkinter import messagebox as mb
-from tkinter import filedialog as fd
-import webbrowser
-from tkinter import ttk
 from typing import List, Callable, Any, Iterable, Optional
 
 from model.beat_mods_version import BeatModsVersion
-from ui.base_table_ui import BaseTableUI
+from ui.base_table_ui import BaseTableUI, memoized_formatter
+
+# tkinter is deliberately only imported inside the methods that need it - pulling it in at module
+# load means console mode pays for Tcl initialization even though it never opens a window
 
 
 class GraphicalTableUI(BaseTableUI):
+    # the values are the tk.CENTER/tk.W/tk.E anchor constants, spelled as the plain strings
+    # they are defined as so the module doesn't need tkinter imported to build this table
     __ALIGNMENT_LOOKUP = {
-        'c': tk.CENTER,
-        'l': tk.W,
-        'r': tk.E
+        'c': 'center',
+        'l': 'w',
+        'r': 'e'
     }
 
     def __is_mouse_in_last_column(self, mouse_x):
-        *_, last = iter(self._table['columns'])
-        col = self._table.identify_column(mouse_x)
-        return col == f'#{last}'
+        return self._table.identify_column(mouse_x) == self._last_col_id
 
     def __get_mouse_row_link_text(self, mouse_y):
         row_id = self._table.identify_row(mouse_y)
@@ -31,11 +29,20 @@ class GraphicalTableUI(BaseTableUI):
         if region == "cell" and self.__is_mouse_in_last_column(event.x):
             link_text = self.__get_mouse_row_link_text(event.y)
             if link_text != "-":
+                import webbrowser
                 webbrowser.open(link_text)
         if self._table.identify_region(event.x, event.y) == "separator":
             return "break"
 
     def __treeview_motion(self, event):
+        # motion events arrive at mouse-poll rate; skip the identify_* Tcl calls entirely unless
+        # the cursor actually moved a meaningful amount, repeating the previous handler result
+        # so separator events stay suppressed
+        last_x, last_y = self._last_motion_pos
+        if abs(event.x - last_x) < 3 and abs(event.y - last_y) < 3:
+            return self._last_motion_result
+        self._last_motion_pos = (event.x, event.y)
+
         region = self._table.identify_region(event.x, event.y)
         if (region == "cell" and self.__is_mouse_in_last_column(event.x)
                 and self.__get_mouse_row_link_text(event.y) != "-"):
@@ -43,12 +50,15 @@ class GraphicalTableUI(BaseTableUI):
         else:
             self._gui.config(cursor="arrow")
 
-        if region == "separator":
-            return "break"
+        self._last_motion_result = "break" if region == "separator" else None
+        return self._last_motion_result
 
     def __init__(self, header: List[str], align: List[str], dtype: List[Callable[[Any], str]],
                  width: int = 1000, height: int = 600):
-        self._dtypes = dtype
+        import tkinter as tk
+        from tkinter import ttk
+
+        self._dtypes = tuple(memoized_formatter(f) for f in dtype)
 
         # configure root window
         self._gui = gui = tk.Tk()
@@ -67,18 +77,26 @@ class GraphicalTableUI(BaseTableUI):
                          width=col_width, minwidth=col_width)
             table.heading(str(i), text=h)
 
+        # the link column is always the last one; precompute its Treeview identifier so the
+        # per-mouse-event handlers don't rebuild it from the column list every time
+        self._last_col_id = f'#{len(header)}'
+        self._last_motion_pos = (-1, -1)
+        self._last_motion_result = None
+
         table.bind("<Button-1>", self.__treeview_click)
         table.bind("<Motion>", self.__treeview_motion)
 
         # add scrollbars for the treeview
-        yscroll = ttk.Scrollbar(gui, orient=tk.VERTICAL, command=table.yview)
-        xscroll = ttk.Scrollbar(gui, orient=tk.HORIZONTAL, command=table.xview)
+        # the tk.* layout constants are just these strings; using them directly skips the
+        # module attribute lookups entirely
+        yscroll = ttk.Scrollbar(gui, orient="vertical", command=table.yview)
+        xscroll = ttk.Scrollbar(gui, orient="horizontal", command=table.xview)
         table.configure(yscrollcommand=yscroll.set, xscrollcommand=xscroll.set)
 
         # do layout
-        yscroll.grid(row=0, column=1, sticky=tk.NS)
-        xscroll.grid(row=1, column=0, sticky=tk.EW)
-        table.grid(row=0, column=0, sticky=tk.NSEW)
+        yscroll.grid(row=0, column=1, sticky="ns")
+        xscroll.grid(row=1, column=0, sticky="ew")
+        table.grid(row=0, column=0, sticky="nsew")
         gui.rowconfigure(0, weight=1)
         gui.columnconfigure(0, weight=1)
 
@@ -89,16 +107,25 @@ class GraphicalTableUI(BaseTableUI):
         self._gui.title(f"Beat Saber Mod Upgrade - {old_version.alias} to {new_version.alias}")
 
     def add_items(self, items: Iterable[Iterable]):
+        # hoist the attribute lookups out of the loop - this runs once per row and the lambda/zip
+        # machinery it replaces allocated a closure and tuples per cell
+        dtypes = self._dtypes
+        # call straight into Tcl rather than through the ttk wrapper, which re-validates options
+        # and rebuilds an option list for every row. The window is still withdrawn while rows are
+        # added, so no layout work happens until show()
+        tk_call = self._table.tk.call
+        table_path = self._table._w
         for item in items:
-            mapped_row = list(map(lambda x: x[0](x[1]), zip(self._dtypes, item)))
-            self._table.insert("", tk.END, values=mapped_row)
+            tk_call(table_path, 'insert', '', 'end', '-values', [f(v) for f, v in zip(dtypes, item)])
 
     def show(self):
         self._gui.deiconify()
         self._gui.mainloop()
 
     def alert(self, message: str):
+        from tkinter import messagebox as mb
         mb.showerror(message=message)
 
     def prompt_for_directory(self, message: Optional[str] = None) -> Optional[str]:
+        from tkinter import filedialog as fd
         return fd.askdirectory(title=message, mustexist=True)
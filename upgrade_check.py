@@ -1,9 +1,8 @@
 import argparse
-import itertools
-import re
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple, Union, Callable, Any, Iterable
+from typing import List, Optional, Tuple, Union, Any, Iterable
 
 from pypref import SinglePreferences as Preferences
 
@@ -26,8 +25,10 @@ def validate_beat_saber_version(value: str) -> BeatModsVersion:
     :param value: The raw command line argument
     :return: A valid BeatModsVersion represented by the input
     """
-    # 1.1.0p1 is a valid version, so we should assume that the build can contain non-numeric characters
-    if re.match(VERSION_REGEX, value):
+    # 1.1.0p1 is a valid version, so we should assume that the build can contain non-numeric characters.
+    # fullmatch rather than match - the pattern is only left-anchored, so trailing garbage used to slip
+    # through to a pointless BeatMods lookup before failing anyway
+    if VERSION_PATTERN.fullmatch(value):
         version = bs.get_beat_saber_version(value)
         if version:
             return version
@@ -58,6 +59,20 @@ class NewlineSmartFormatter(argparse.HelpFormatter):
                           in textwrap.indent(textwrap.dedent(text), indent).splitlines()])
 
 
+class CachedFormatterArgumentParser(argparse.ArgumentParser):
+    """
+    ArgumentParser that reuses one formatter for add_argument validation. Python 3.14 builds a
+    fresh help formatter on every add_argument call just to validate it, which dominates parser
+    construction time there; older versions don't have the hook and are unaffected.
+    """
+    if hasattr(argparse.ArgumentParser, "_get_validation_formatter"):
+        def _get_validation_formatter(self):
+            cached = getattr(self, "_validation_formatter", None)
+            if cached is None:
+                cached = self._validation_formatter = super()._get_validation_formatter()
+            return cached
+
+
 def boolean_text(text: Optional[str]) -> str:
     """
     Formats a string as yes/no depending on whether it is present
@@ -96,10 +111,14 @@ def make_mod_diff_to_rows(mod_diff: List[Tuple[Mod, Optional[Mod]]], include_upg
     """
     Converts a list of mod diffs to table rows
     """
-    return [[old.name, old.version, safe_version(new), old.version, safe_version(new), old.link]
-            for old, new in sorted(mod_diff, key=lambda x: mod_name_sort_order(x[0]))
-            # if we want to include upgradeable mods, get everything. otherwise only get it if there's no new version
-            if include_upgradeable or safe_version(new) is None]
+    rows = []
+    for old, new in sorted(mod_diff, key=lambda pair: mod_name_sort_order(pair[0])):
+        # computed once per pair - the old comprehension re-ran this for each of its three uses
+        new_version = safe_version(new)
+        # if we want to include upgradeable mods, get everything. otherwise only get it if there's no new version
+        if include_upgradeable or new_version is None:
+            rows.append([old.name, old.version, new_version, old.version, new_version, old.link])
+    return rows
 
 
 def make_mod_list_to_rows(mods: List[Mod]):
@@ -107,34 +126,21 @@ def make_mod_list_to_rows(mods: List[Mod]):
     Converts a list of mods to table rows, assuming they are not available on BeatMods. Since installed mods can yield
     a single mod object per file, this also filters down to uniquely named mods
     """
-    unique_names = set(map(lambda x: x.name, mods))
+    # a comprehension skips the per-element lambda call dispatch that map(lambda ...) pays
+    unique_names = {mod.name for mod in mods}
     return [[mod_name, None, None, None, None, None] for mod_name in sorted(unique_names, key=mod_name_sort_order)]
 
 
-def make_slicing_function(*slicers: slice) -> Callable[[List[Any]], List[Any]]:
-    """
-    Makes a slicing function that composes a new list out of various slices of the original list
-    :param slicers: The slicers to use
-    :return: A callable that can slice the new list
-    """
-    def closure(items: List[Any]) -> List[Any]:
-        return list(itertools.chain.from_iterable(items[s] for s in slicers))
-    return closure
-
-
-def slice_columns(slicer_fn: Callable[[List[Any]], List[Any]],
-                  rows: List[Any]) -> Iterable:
+def project_columns(indices: List[int], rows: Iterable[Iterable]) -> List[List[Any]]:
     """
-    Gets a customizable slice of columns from a list of rows or column properties
+    Gets a customizable selection of columns from a list of rows or column properties. Everything
+    stays row-major - the previous approach transposed rows to columns, sliced, and transposed
+    back, allocating a tuple per row on each trip
+    :param indices: The column indices to keep, in output order
     :param rows: The rows of the table, or a list of column properties. All rows should be of the same length.
-    :param slicer_fn: A slicing function to use.
-    :return: An iterable of the rows after slicing the columns.
+    :return: The rows restricted to the selected columns.
     """
-    # transpose to columns, then slice the collection of columns
-    column_properties = list(zip(*rows))
-    sliced_column_properties = slicer_fn(column_properties)
-    # transpose back
-    return list(zip(*sliced_column_properties))
+    return [[row[i] for i in indices] for row in rows]
 
 
 def parse_args() -> argparse.Namespace:
@@ -144,7 +150,7 @@ def parse_args() -> argparse.Namespace:
     """
 
     # parsing
-    parser = argparse.ArgumentParser(description="This script can help you determine if it's safe to upgrade your PC"
+    parser = CachedFormatterArgumentParser(description="This script can help you determine if it's safe to upgrade your PC"
                                                  " installation of Beat Saber by telling you which of your installed"
                                                  " mods have a known upgrade available in your target version. It"
                                                  " cannot tell you anything about mods that are not available on Mod"
@@ -207,14 +213,15 @@ def get_install_path_and_update_preferences(ui: BaseTableUI) -> Path:
 
 def main(args: argparse.Namespace):
 
-    # make the appropriate slicer function based on whether versions should be shown
+    # pick which columns to display based on whether versions should be shown
     if args.show_versions:
-        slicer_fn = make_slicing_function(slice(None))
+        column_indices = list(range(len(TABLE_HEADERS)))
     else:
-        slicer_fn = make_slicing_function(slice(3), slice(-1, None))
+        # name, from-beatmods, upgradeable, link - skip the two version columns
+        column_indices = [0, 1, 2, 5]
 
-    # slice headers and column metadata
-    headers, aligns, dtypes = slice_columns(slicer_fn, [TABLE_HEADERS, TABLE_ALIGN, TABLE_DTYPE])
+    # project headers and column metadata down to the chosen columns
+    headers, aligns, dtypes = project_columns(column_indices, [TABLE_HEADERS, TABLE_ALIGN, TABLE_DTYPE])
 
     ui_class = GraphicalTableUI if args.style == UIStyle.GRAPHICAL else ConsoleTableUI
     ui = ui_class(headers, aligns, dtypes)
@@ -230,9 +237,13 @@ def main(args: argparse.Namespace):
                  f"({current_version.alias}).")
         exit(1)
 
-    # get available mods for current and target version
-    current_ver_mods = am.get_mods_for_version(current_version)
-    target_ver_mods = am.get_mods_for_version(target_version)
+    # get available mods for current and target version. the two catalog fetches are independent
+    # network calls, so issue them concurrently rather than paying both latencies back to back
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        current_mods_future = executor.submit(am.get_mods_for_version, current_version)
+        target_mods_future = executor.submit(am.get_mods_for_version, target_version)
+        current_ver_mods = current_mods_future.result()
+        target_ver_mods = target_mods_future.result()
 
     # verify there's a BSIPA install. if not, we're not on a modded install of Beat Saber
     bsipa = im.get_bsipa(install_path)
@@ -250,8 +261,8 @@ def main(args: argparse.Namespace):
     # find which of our installed mods have an available upgrade
     upgrade_diff = im.upgrade_diff(installed_mods_on_beatmods, target_ver_mods)
 
-    mod_installer_rows = slice_columns(slicer_fn, make_mod_diff_to_rows(upgrade_diff, not args.no_upgrade_only))
-    manual_mod_rows = slice_columns(slicer_fn, make_mod_list_to_rows(installed_mods_other))
+    mod_installer_rows = project_columns(column_indices, make_mod_diff_to_rows(upgrade_diff, not args.no_upgrade_only))
+    manual_mod_rows = project_columns(column_indices, make_mod_list_to_rows(installed_mods_other))
 
     ui.add_items(mod_installer_rows)
     ui.add_items(manual_mod_rows)
@@ -1,9 +1,9 @@
-import requests
 from typing import List
 
 from model.beat_mods_version import BeatModsVersion
 from model.mod import FileHash, Mod
 from util.constants import *
+from util.http import SESSION, parse_json
 
 
 def get_mods_for_version(version: BeatModsVersion) -> List[Mod]:
@@ -17,14 +17,17 @@ def get_mods_for_version(version: BeatModsVersion) -> List[Mod]:
         "status": "approved"
     }
 
-    response = requests.get(BEAT_MODS_API + "mod", params=params)
+    response = SESSION.get(BEAT_MODS_API + "mod", params=params)
     # comprehension is just too gross here.
     mods_list = []
-    for mod in response.json():
+    for mod in parse_json(response):
         name = mod["name"]
         version = mod["version"]
         link = mod.get("link", None)
-        files = [[FileHash(obj["file"], obj["hash"]) for obj in download["hashMd5"]] for download in mod["downloads"]]
+        # tuples rather than lists - Mod freezes its file groups anyway, and tuple() of a tuple
+        # is a no-op, so the inner groups are built exactly once instead of list-then-copied
+        files = tuple(tuple(FileHash(obj["file"], obj["hash"]) for obj in download["hashMd5"])
+                      for download in mod["downloads"])
         mods_list.append(Mod(name, version, link, files))
 
     return mods_list
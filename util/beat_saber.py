@@ -1,21 +1,34 @@
-import requests
-import re
+import mmap
+from functools import lru_cache
 from pathlib import Path
 
 from typing import Optional
 
-from model.beat_mods_version import BeatModsVersion
+from model.beat_mods_version import BeatModsVersion, version_key
 from util.constants import *
+from util.http import SESSION, parse_json
 
 
+@lru_cache(maxsize=1)
+def _get_aliases() -> dict:
+    """
+    Fetches the BeatMods alias map, cached for the lifetime of the process. Argument validation,
+    install detection, and the latest-version lookup all need it, and it can't change mid-run -
+    so only the first caller pays the network round-trip.
+    :return: A mapping of each BeatMods version to its list of aliases
+    """
+    return parse_json(SESSION.get(BEAT_MODS_ALIASES))
+
+
+@lru_cache(maxsize=None)
 def get_beat_saber_version(alias: str) -> Optional[BeatModsVersion]:
     """
-    Gets the BeatMods Beat Saber version for a given alias
+    Gets the BeatMods Beat Saber version for a given alias. Results are cached, so repeated
+    resolutions of the same alias are free.
     :param alias: A Beat Saber version number
     :return: The BeatMods version for the given alias, or None if the version doesn't exist.
     """
-    response = requests.get(BEAT_MODS_ALIASES)
-    for version, aliases in response.json().items():
+    for version, aliases in _get_aliases().items():
         if alias == version or alias in aliases:
             return BeatModsVersion(version, alias)
     return None
@@ -26,12 +39,14 @@ def get_latest_beat_saber_version() -> Optional[BeatModsVersion]:
     Gets the latest Beat Saber version from BeatMods
     :return: The BeatMods version for the latest available alias
     """
-    response = requests.get(BEAT_MODS_ALIASES)
-    # flatten the list of aliases
-    versions = [[BeatModsVersion(version, version)] + [BeatModsVersion(version, alias) for alias in aliases]
-                for version, aliases in response.json().items()]
-    flattened = [version for sublist in versions for version in sublist]
-    return max(flattened)
+    aliases = _get_aliases()
+    if not aliases:
+        return None
+    # ordering between groups only depends on the version, so find the newest group first and
+    # only then the newest alias inside it, instead of materializing a BeatModsVersion for
+    # every (version, alias) pair just to call max
+    latest = max(aliases, key=version_key)
+    return BeatModsVersion(latest, max([latest] + list(aliases[latest]), key=version_key))
 
 
 def get_installed_version(install_path: Path) -> Optional[BeatModsVersion]:
@@ -47,11 +62,17 @@ def get_installed_version(install_path: Path) -> Optional[BeatModsVersion]:
         return None
 
     with version_file.open('rb') as data:
-        file_content = data.read().decode("utf_8", "ignore")
-    idx = file_content.index("public.app-category.games")
-    # the version number starts 136 characters after this key and exists in a 32-byte chunk.
-    ver_block = file_content[idx + 136:idx + 136 + 32]
+        # the file can be several MB; mmap lets the kernel page in only what the search touches
+        # instead of reading and utf-8 decoding the whole thing up front
+        with mmap.mmap(data.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            idx = mm.find(b"public.app-category.games")
+            if idx == -1:
+                return None
+            # the version number starts 136 characters after this key and exists in a 32-byte chunk.
+            ver_block = mm[idx + 136:idx + 136 + 32].decode("utf_8", "ignore")
     # trim to only the actual version number
-    ver = re.search(VERSION_REGEX, ver_block).group(0)
+    match = VERSION_PATTERN.search(ver_block)
+    if not match:
+        return None
     # we now have a valid alias, go fetch details from BeatMods
-    return get_beat_saber_version(ver)
+    return get_beat_saber_version(match.group(0))
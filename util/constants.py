@@ -1,3 +1,6 @@
+# aliased so the module object itself doesn't leak through star imports
+import re as _re
+
 # API URL paths
 BEAT_MODS_API = "https://beatmods.com/api/v1/"
 BEAT_MODS_VERSIONS = "https://versions.beatmods.com/versions.json"
@@ -7,5 +10,7 @@ BEAT_MODS_ALIASES = "https://alias.beatmods.com/aliases.json"
 PREFERENCES_FILE = "CanIUpgradeBeatSaber-preferences.py"
 PREF_INSTALL_DIRECTORY = "BSInstallDir"
 
-# Version parsing
+# Version parsing. The raw string stays available for backward compat; use the compiled
+# pattern so match/search calls don't re-consult re's compile cache every time
 VERSION_REGEX = r"\d+\.\d+\.[a-zA-Z0-9]+"
+VERSION_PATTERN = _re.compile(VERSION_REGEX)
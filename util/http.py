@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def parse_json(response: requests.Response):
+    """
+    Parses a response body as JSON, preferring orjson when it's installed - it decodes the large
+    mod catalog payloads several times faster than the stdlib json behind response.json(), and
+    returns the same plain dicts/lists.
+    :param response: The response to parse
+    :return: The decoded JSON payload
+    """
+    if orjson:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _make_session() -> requests.Session:
+    """
+    Builds the session shared by all BeatMods calls. The aliases and mod catalogs change rarely,
+    so when requests-cache is installed responses are cached on disk and repeat runs within the
+    TTL skip the network entirely. Without it this degrades to a plain session.
+    :return: The session to use for BeatMods requests
+    """
+    if CachedSession:
+        cache_dir = Path.home() / ".cache" / "CanIUpgradeBeatSaber"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # honor server cache headers when present, falling back to a 1 hour TTL
+        session = CachedSession(cache_name=str(cache_dir / "beatmods"), expire_after=3600,
+                                cache_control=True)
+    else:
+        session = requests.Session()
+    # pool connections so the several BeatMods calls per run reuse one TCP+TLS connection
+    # (keep-alive is the default) instead of paying a fresh handshake each. sized for the
+    # concurrent catalog fetches
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    return session
+
+
+SESSION = _make_session()
@@ -1,4 +1,7 @@
 import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from typing import List, Tuple, Optional
@@ -8,16 +11,19 @@ from model.mod import Mod, FileHash
 
 def _hash_file(file: Path) -> str:
     """
-    Gets the MD5 hash of a file
+    Gets the MD5 hash of a file, streaming the content rather than loading it all at once -
+    mod DLLs can be several MB and there's one of these calls per installed file
     :param file: The file to hash
     :return: The hash of the file's content
     """
     with file.open('rb') as f:
-        byte_data = f.read()
-    m = hashlib.md5()
-    m.update(byte_data)
-
-    return m.hexdigest().lower()
+        # 3.11+ can run the whole read/update loop in C
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "md5").hexdigest().lower()
+        m = hashlib.md5()
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            m.update(chunk)
+        return m.hexdigest().lower()
 
 
 def get_bsipa(install_dir: Path) -> Mod:
@@ -27,8 +33,8 @@ def get_bsipa(install_dir: Path) -> Mod:
     """
     injector_path = install_dir / "Beat Saber_Data" / "Managed" / "IPA.Injector.dll"
     if injector_path.exists():
-        injector_hash = _hash_file(injector_path)
-        return Mod("BSIPA", None, None, [[FileHash(str(injector_path), injector_hash)]])
+        return Mod("BSIPA", None, None,
+                   [[FileHash(str(injector_path), hash_fn=partial(_hash_file, injector_path))]])
 
 
 def get_installed_mods(install_dir: Path) -> List[Mod]:
@@ -40,15 +46,28 @@ def get_installed_mods(install_dir: Path) -> List[Mod]:
     mod_locations = ["IPA/Pending/Plugins", "IPA/Pending/Libs", "Plugins", "Libs"]
     mod_paths = [install_dir / subdir for subdir in mod_locations]
 
-    installed_mods = []
+    candidate_files = []
     for path in mod_paths:
         if path.exists():
-            for file in path.iterdir():
-                # skip subdirs if there is any
-                if file.is_file() and (file.suffix == ".dll" or file.suffix == ".manifest"):
-                    file_hash = _hash_file(file)
-                    installed_mods.append(Mod(file.stem, None, None, [[FileHash(str(file), file_hash)]]))
-
+            # scandir's DirEntry caches the file type from the directory read itself, so is_file
+            # usually costs no extra stat, and checking the raw name skips Path suffix parsing.
+            # only matches pay for a Path object
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    # skip subdirs if there is any
+                    if entry.is_file() and (entry.name.endswith(".dll") or entry.name.endswith(".manifest")):
+                        candidate_files.append(Path(entry.path))
+
+    # hash on a thread pool - md5 releases the GIL inside hashlib and the reads block on I/O,
+    # so this scales close to linearly with core count over a serial loop. the futures are
+    # handed to lazily-resolved FileHash objects rather than awaited here, so this function
+    # returns immediately and hashing overlaps with whatever the caller does next; a hash that
+    # is never read never blocks anyone
+    executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+    installed_mods = [Mod(file.stem, None, None,
+                          [[FileHash(str(file), hash_fn=executor.submit(_hash_file, file).result)]])
+                      for file in candidate_files]
+    executor.shutdown(wait=False)
     return installed_mods
 
 
@@ -60,22 +79,28 @@ def intersect_against_available(installed_mods: List[Mod],
     :param available_mods_for_version: A list of available mods
     :return: A list of mods available on BeatMods and a list of mods that are not
     """
-    # for each AVAILABLE mod, check them against all the installed mods
-    installed_available = []
-    installed_mods_found_available = []
+    # index every available file hash once, so each installed mod is classified with O(1) dict
+    # lookups instead of a scan over the entire available list
+    hash_index = {file_hash: available for available in available_mods_for_version
+                  for file_hash in available.hash_set}
 
+    installed_available = []
+    # Mod hashes by identity, so a set gives O(1) uniqueness checks while the list keeps the
+    # stable output order
+    seen_available = set()
+    installed_not_available = []
     for installed in installed_mods:
-        if installed not in installed_mods_found_available:
-            for available in available_mods_for_version:
-                if available.do_file_hashes_match(installed):
-                    # found match
-                    installed_mods_found_available.append(installed)
-                    # keep the list of available installed mods unique
-                    if available not in installed_available:
-                        installed_available.append(available)
-    # filter to any installed mods with no matching available mod
-    installed_not_available = [installed for installed in installed_mods
-                               if installed not in installed_mods_found_available]
+        match = None
+        for file_hash in installed.hash_set:
+            match = hash_index.get(file_hash)
+            if match is not None:
+                break
+        if match is None:
+            installed_not_available.append(installed)
+        # keep the list of available installed mods unique
+        elif match not in seen_available:
+            seen_available.add(match)
+            installed_available.append(match)
     return installed_available, installed_not_available
 
 
@@ -87,16 +112,10 @@ def upgrade_diff(installed_mods: List[Mod], available_mods: List[Mod]) -> List[T
     :param available_mods: List of available mods
     :return: List of pairs of mods (old, new)
     """
-    pairs = []
-    found_match = []
-    for installed in installed_mods:
-        if installed not in found_match:
-            for available in available_mods:
-                if installed.do_names_match(available):
-                    pairs.append((installed, available))
-                    found_match.append(installed)
-                    break
-            # if no match, record that as well
-            if installed not in found_match:
-                pairs.append((installed, None))
-    return pairs
+    # index by name once so pairing is an O(1) lookup per installed mod instead of a scan over
+    # the whole available list. setdefault keeps the first occurrence of a duplicated name,
+    # matching the old first-match-in-list behavior
+    by_name = {}
+    for available in available_mods:
+        by_name.setdefault(available.name, available)
+    return [(installed, by_name.get(installed.name)) for installed in installed_mods]